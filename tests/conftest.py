@@ -5,33 +5,77 @@ This file provides common fixtures used across unit and integration tests.
 """
 
 import pytest
+import copy
 import os
 import sys
-import tempfile
+import textwrap
+from pathlib import Path
 from unittest.mock import Mock
 
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path (shared by all test modules)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Tests under this directory are auto-marked as integration tests
+INTEGRATION_ROOT = Path(__file__).parent / 'integration'
+
+# Collector configuration written by temp_config_file
+_TEST_YAML = textwrap.dedent("""\
+    collectors:
+      - name: test_collector
+        api_key: ${TEST_API_KEY}
+        access_token: ${TEST_ACCESS_TOKEN}
+        auto_start: false
+        symbols:
+          - RELIANCE
+          - TCS
+        mode: full
+""")
 
 
-@pytest.fixture
-def mock_database():
-    """Create a mock database instance"""
+def reset_shared_mock(mock, defaults):
+    """Reset a shared Mock's calls, return values and side effects between tests
+
+    Only the public reset/configure API is used, so attributes a test adds
+    to (or deletes from) a shared mock are not undone; tests must configure
+    shared mocks through return values and side effects only. ``defaults``
+    are copied on each reset so mutable defaults don't carry over.
+    """
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.configure_mock(**{key: copy.copy(value) for key, value in defaults.items()})
+
+
+# Return values restored on the shared mock database before every test
+MOCK_DATABASE_DEFAULTS = {
+    'GetInstrumentToken.return_value': 738561,
+    'InsertTickData.return_value': None,
+    'InsertIntradayBar.return_value': None,
+    'BulkInsertIntradayBars.return_value': None,
+    'GetIntradayBars.return_value': [],
+    'GetLatestIntradayBar.return_value': None,
+}
+
+
+@pytest.fixture(scope="session")
+def _shared_mock_database():
+    """Mock database built once per session and reset by mock_database"""
     db = Mock()
 
     # Mock common database methods
-    db.GetInstrumentToken = Mock(return_value=738561)
-    db.InsertTickData = Mock(return_value=None)
-    db.InsertIntradayBar = Mock(return_value=None)
-    db.BulkInsertIntradayBars = Mock(return_value=None)
-    db.GetIntradayBars = Mock(return_value=[])
-    db.GetLatestIntradayBar = Mock(return_value=None)
-    db.Close = Mock()
+    db.configure_mock(**MOCK_DATABASE_DEFAULTS)
 
     return db
 
 
 @pytest.fixture
+def mock_database(_shared_mock_database):
+    """Create a mock database instance (shared, reset for each test)"""
+    reset_shared_mock(_shared_mock_database, MOCK_DATABASE_DEFAULTS)
+    return _shared_mock_database
+
+
+@pytest.fixture(scope="session")
 def sample_tick_data():
     """Sample tick data for testing"""
     return {
@@ -44,7 +88,7 @@ def sample_tick_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candle_data():
     """Sample OHLCV candle data"""
     return {
@@ -62,56 +106,40 @@ def sample_candle_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_symbols():
     """Sample symbol list for testing"""
     return ['RELIANCE', 'TCS', 'INFY', 'HDFCBANK', 'ICICIBANK']
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_prices():
     """Sample price series for indicator calculations"""
     return [100.0, 102.0, 101.0, 103.0, 105.0, 104.0, 106.0, 108.0, 107.0, 109.0]
 
 
 @pytest.fixture
-def temp_database():
-    """Create temporary SQLite database for testing"""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
+def temp_database(tmp_path):
+    """Path for a temporary SQLite database (removed by pytest)"""
+    return str(tmp_path / 'test.db')
 
-    yield db_path
 
-    # Cleanup
-    if os.path.exists(db_path):
-        os.unlink(db_path)
-
-
-@pytest.fixture
-def temp_config_file():
-    """Create temporary configuration file"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        f.write("""
-collectors:
-  - name: test_collector
-    api_key: ${TEST_API_KEY}
-    access_token: ${TEST_ACCESS_TOKEN}
-    auto_start: false
-    symbols:
-      - RELIANCE
-      - TCS
-    mode: full
-""")
-        config_path = f.name
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create temporary configuration file (written once per session)"""
+    config_path = tmp_path_factory.mktemp('cfg') / 'config.yaml'
+    config_path.write_text(_TEST_YAML)
+    return str(config_path)
 
-    yield config_path
 
-    # Cleanup
-    if os.path.exists(config_path):
-        os.unlink(config_path)
+@pytest.fixture(scope="session")
+def parsed_test_config():
+    """Parsed form of the temp_config_file contents (no file I/O)"""
+    yaml = pytest.importorskip('yaml')
+    return yaml.safe_load(_TEST_YAML)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_zerodha_response():
     """Mock Zerodha API response"""
     return {
@@ -129,7 +157,7 @@ def mock_zerodha_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_market_quote():
     """Mock market quote data"""
     return {
@@ -201,14 +229,18 @@ def pytest_configure(config):
 # Pytest hooks
 def pytest_collection_modifyitems(config, items):
     """Auto-mark integration tests"""
+    integration_marker = pytest.mark.integration
+    db_marker = pytest.mark.db
+
     for item in items:
         # Auto-mark tests in integration folder
-        if "integration" in str(item.fspath):
-            item.add_marker(pytest.mark.integration)
+        if INTEGRATION_ROOT in item.path.parents:
+            item.add_marker(integration_marker)
 
         # Auto-mark tests with 'db' in name
-        if "db" in item.name or "database" in item.name:
-            item.add_marker(pytest.mark.db)
+        name = item.name
+        if "db" in name or "database" in name:
+            item.add_marker(db_marker)
 
 
 # Custom assertions
@@ -222,22 +254,38 @@ def assert_valid_timestamp(timestamp_str):
         return False
 
 
+_OHLC_KEYS = ('open', 'high', 'low', 'close')
+
+
 def assert_valid_ohlc(ohlc_data):
     """Assert OHLC data is valid"""
-    assert 'open' in ohlc_data
-    assert 'high' in ohlc_data
-    assert 'low' in ohlc_data
-    assert 'close' in ohlc_data
+    missing = [key for key in _OHLC_KEYS if key not in ohlc_data]
+    assert not missing, f"missing OHLC keys: {missing}"
+
+    o, hi, lo, c = (ohlc_data[key] for key in _OHLC_KEYS)
+
+    # High should be highest, low should be lowest
+    assert hi >= o and hi >= c and lo <= o and lo <= c
+
+
+def assert_valid_ohlc_batch(ohlc_columns):
+    """Assert many OHLC rows are valid (DataFrame or dict of column sequences)"""
+    missing = [key for key in _OHLC_KEYS if key not in ohlc_columns]
+    assert not missing, f"missing OHLC columns: {missing}"
 
-    # High should be highest
-    assert ohlc_data['high'] >= ohlc_data['open']
-    assert ohlc_data['high'] >= ohlc_data['close']
+    columns = [ohlc_columns[key] for key in _OHLC_KEYS]
+    lengths = {key: len(column) for key, column in zip(_OHLC_KEYS, columns)}
+    assert len(set(lengths.values())) == 1, f"OHLC column lengths differ: {lengths}"
 
-    # Low should be lowest
-    assert ohlc_data['low'] <= ohlc_data['open']
-    assert ohlc_data['low'] <= ohlc_data['close']
+    invalid = [
+        row for row, (o, hi, lo, c) in enumerate(zip(*columns))
+        if not (hi >= max(o, c) and lo <= min(o, c))
+    ]
+    assert not invalid, f"invalid OHLC rows: {invalid}"
 
 
 # Add custom assertions to pytest namespace
 pytest.assert_valid_timestamp = assert_valid_timestamp
 pytest.assert_valid_ohlc = assert_valid_ohlc
+pytest.assert_valid_ohlc_batch = assert_valid_ohlc_batch
+pytest.reset_shared_mock = reset_shared_mock
@@ -0,0 +1,62 @@
+"""
+Unit tests for the custom assertions in conftest
+
+Tests the OHLC validation helpers registered on the pytest namespace.
+"""
+
+import pytest
+
+
+class TestAssertValidOhlc:
+    """Test single-row OHLC validation"""
+
+    def test_valid_row(self):
+        """Test a consistent OHLC row passes"""
+        pytest.assert_valid_ohlc({'open': 100.0, 'high': 105.0, 'low': 99.0, 'close': 102.0})
+
+    def test_missing_key_named(self):
+        """Test a missing key is reported by name"""
+        with pytest.raises(AssertionError, match="close"):
+            pytest.assert_valid_ohlc({'open': 100.0, 'high': 105.0, 'low': 99.0})
+
+    def test_high_below_close(self):
+        """Test high below close fails"""
+        with pytest.raises(AssertionError):
+            pytest.assert_valid_ohlc({'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 102.0})
+
+
+class TestAssertValidOhlcBatch:
+    """Test column-oriented OHLC validation"""
+
+    def test_valid_columns(self):
+        """Test consistent OHLC columns pass"""
+        pytest.assert_valid_ohlc_batch({
+            'open': [100.0, 102.0],
+            'high': [105.0, 104.0],
+            'low': [99.0, 101.0],
+            'close': [102.0, 103.0],
+        })
+
+    def test_invalid_row_reported(self):
+        """Test an inconsistent row fails and is reported by index"""
+        with pytest.raises(AssertionError, match=r"\[1\]"):
+            pytest.assert_valid_ohlc_batch({
+                'open': [100.0, 102.0],
+                'high': [105.0, 101.0],
+                'low': [99.0, 100.0],
+                'close': [102.0, 103.0],
+            })
+
+    def test_mismatched_lengths(self):
+        """Test columns of different lengths fail instead of truncating"""
+        with pytest.raises(AssertionError, match="lengths differ"):
+            pytest.assert_valid_ohlc_batch({'open': [1, 2], 'high': [2], 'low': [0], 'close': [1]})
+
+    def test_missing_column(self):
+        """Test a missing column fails as an assertion, not a KeyError"""
+        with pytest.raises(AssertionError, match="close"):
+            pytest.assert_valid_ohlc_batch({'open': [1], 'high': [2], 'low': [0]})
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -5,29 +5,82 @@ Tests the DataCollector and CollectorManager without actual WebSocket connection
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import time
-from datetime import datetime
+import copy
+from unittest.mock import Mock
 
 # Import collector modules
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 from internal.collector.collector import DataCollector, CandleBuilder
 from internal.collector.manager import CollectorManager
 
+# Ticker methods used by DataCollector (mirrors gokiteconnect's kiteticker.Ticker)
+TICKER_METHODS = [
+    'OnConnect', 'OnTick', 'OnReconnect', 'OnNoReconnect', 'OnError', 'OnClose',
+    'OnOrderUpdate', 'SetAutoReconnect', 'SetReconnectMaxRetries',
+    'SetReconnectMaxDelay', 'Serve', 'Stop', 'Subscribe', 'Unsubscribe', 'SetMode',
+]
+
+
+# DataCollector attributes holding external resources; kept by reference in snapshots
+_SHARED_COLLECTOR_ATTRS = ('db', 'ticker')
+
+
+def _copy_state(state):
+    """Deep-copy a DataCollector __dict__ so a test's changes can be undone
+
+    Everything except the attributes in _SHARED_COLLECTOR_ATTRS is deep-copied
+    (nested containers, candle builders and all); those are kept by reference,
+    so restoring reassigns them but does not undo changes made through them.
+    Raises if the collector grows state that cannot be deep-copied, e.g. a lock.
+    """
+    memo = {id(state[key]): state[key] for key in _SHARED_COLLECTOR_ATTRS if key in state}
+    return copy.deepcopy(state, memo)
+
+
+class SharedMockDB:
+    """Mixin giving a test class one mock database, reset before each test
+
+    Subclasses set MOCK_DB_DEFAULTS to the configure_mock() defaults.
+    """
+
+    MOCK_DB_DEFAULTS = {}
+
+    @pytest.fixture(scope="class")
+    def mock_db(self):
+        """Create mock database (shared across the class)"""
+        db = Mock()
+        db.configure_mock(**self.MOCK_DB_DEFAULTS)
+        return db
+
+    @pytest.fixture(autouse=True)
+    def _reset_mock_db(self, mock_db):
+        """Reset the shared mock database before each test"""
+        pytest.reset_shared_mock(mock_db, self.MOCK_DB_DEFAULTS)
+
+
+@pytest.fixture
+def fresh_builder():
+    """CandleBuilder initialized for RELIANCE 1m candles"""
+    builder = CandleBuilder()
+    builder.InstrumentToken = 738561
+    builder.Symbol = "RELIANCE"
+    builder.Exchange = "NSE"
+    builder.Timeframe = "1m"
+    return builder
+
+
+@pytest.fixture
+def fixed_minute():
+    """Deterministic minute-aligned candle timestamp"""
+    from datetime import datetime
+    return datetime(2024, 1, 30, 10, 30, 0)
+
 
 class TestCandleBuilder:
     """Test candle aggregation logic"""
 
-    def test_candle_builder_initialization(self):
+    def test_candle_builder_initialization(self, fresh_builder):
         """Test CandleBuilder initialization"""
-        builder = CandleBuilder()
-        builder.InstrumentToken = 738561
-        builder.Symbol = "RELIANCE"
-        builder.Exchange = "NSE"
-        builder.Timeframe = "1m"
+        builder = fresh_builder
 
         assert builder.InstrumentToken == 738561
         assert builder.Symbol == "RELIANCE"
@@ -35,19 +88,15 @@ class TestCandleBuilder:
         assert builder.Timeframe == "1m"
         assert builder.CurrentTimestamp.year == 1  # Zero time
 
-    def test_candle_aggregation_first_tick(self):
+    def test_candle_aggregation_first_tick(self, fresh_builder, fixed_minute):
         """Test first tick initializes candle correctly"""
-        builder = CandleBuilder()
-        builder.InstrumentToken = 738561
-        builder.Symbol = "RELIANCE"
-        builder.Exchange = "NSE"
-        builder.Timeframe = "1m"
+        builder = fresh_builder
 
         # Simulate first tick
         tick_price = 2500.50
         tick_quantity = 100
 
-        current_minute = datetime.now().replace(second=0, microsecond=0)
+        current_minute = fixed_minute
 
         # Check if candle needs initialization
         if builder.CurrentTimestamp.year == 1 or builder.CurrentTimestamp != current_minute:
@@ -64,13 +113,10 @@ class TestCandleBuilder:
         assert builder.CurrentClose == 2500.50
         assert builder.CurrentVolume == 100
 
-    def test_candle_update_high_low(self):
+    def test_candle_update_high_low(self, fresh_builder, fixed_minute):
         """Test candle high/low updates correctly"""
-        builder = CandleBuilder()
-        builder.InstrumentToken = 738561
-        builder.Symbol = "RELIANCE"
-        builder.Timeframe = "1m"
-        builder.CurrentTimestamp = datetime.now().replace(second=0, microsecond=0)
+        builder = fresh_builder
+        builder.CurrentTimestamp = fixed_minute
         builder.CurrentOpen = 2500.00
         builder.CurrentHigh = 2500.00
         builder.CurrentLow = 2500.00
@@ -100,66 +146,95 @@ class TestCandleBuilder:
         assert builder.CurrentVolume == 225
 
 
-class TestDataCollector:
+class TestDataCollector(SharedMockDB):
     """Test DataCollector class"""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create mock database"""
-        db = Mock()
-        db.InsertTickData = Mock(return_value=None)
-        db.InsertIntradayBar = Mock(return_value=None)
-        db.GetInstrumentToken = Mock(return_value=738561)
-        return db
+    MOCK_DB_DEFAULTS = {
+        'InsertTickData.return_value': None,
+        'InsertIntradayBar.return_value': None,
+        'GetInstrumentToken.return_value': 738561,
+    }
 
-    @pytest.fixture
-    def collector(self, mock_db):
-        """Create DataCollector instance with mocked dependencies"""
+    @pytest.fixture(scope="class")
+    def pooled_collector(self, mock_db):
+        """DataCollector shared across the class (restored after each test)"""
         return DataCollector(mock_db, "test_api_key", "test_access_token")
 
-    def test_collector_initialization(self, collector, mock_db):
+    @pytest.fixture(autouse=True)
+    def _restore_pooled_collector(self, pooled_collector):
+        """Undo any changes a test makes to the shared collector"""
+        snapshot = _copy_state(vars(pooled_collector))
+        yield
+        vars(pooled_collector).clear()
+        vars(pooled_collector).update(snapshot)
+
+    def test_pooled_state_mutation(self, pooled_collector):
+        """Mutate the shared collector in place (checked by the next test)"""
+        pooled_collector.RegisterSymbol(738561, "NSE", "RELIANCE")
+        pooled_collector.candleBuilders[738561].CurrentVolume = 500
+        pooled_collector.ticksReceived = 100
+
+    def test_pooled_state_restored(self, pooled_collector):
+        """Test changes from the previous test did not leak"""
+        assert 738561 not in pooled_collector.tokenToSymbol
+        assert 738561 not in pooled_collector.candleBuilders
+        assert pooled_collector.ticksReceived == 0
+
+    def test_collector_initialization(self, pooled_collector, mock_db):
         """Test DataCollector initialization"""
-        assert collector.db == mock_db
-        assert collector.apiKey == "test_api_key"
-        assert collector.accessToken == "test_access_token"
-        assert collector.running == False
-        assert len(collector.subscribedTokens) == 0
-        assert len(collector.tokenToSymbol) == 0
-        assert collector.ticksReceived == 0
-        assert collector.barsCreated == 0
-
-    def test_register_symbol(self, collector):
+        snapshot = {
+            "db": pooled_collector.db,
+            "apiKey": pooled_collector.apiKey,
+            "accessToken": pooled_collector.accessToken,
+            "running": pooled_collector.running,
+            "subscribedTokens": len(pooled_collector.subscribedTokens),
+            "tokenToSymbol": len(pooled_collector.tokenToSymbol),
+            "ticksReceived": pooled_collector.ticksReceived,
+            "barsCreated": pooled_collector.barsCreated,
+        }
+
+        assert snapshot == {
+            "db": mock_db,
+            "apiKey": "test_api_key",
+            "accessToken": "test_access_token",
+            "running": False,
+            "subscribedTokens": 0,
+            "tokenToSymbol": 0,
+            "ticksReceived": 0,
+            "barsCreated": 0,
+        }
+
+    def test_register_symbol(self, pooled_collector):
         """Test symbol registration"""
-        collector.RegisterSymbol(738561, "NSE", "RELIANCE")
+        pooled_collector.RegisterSymbol(738561, "NSE", "RELIANCE")
 
-        assert 738561 in collector.tokenToSymbol
-        assert collector.tokenToSymbol[738561] == "RELIANCE"
-        assert 738561 in collector.candleBuilders
-        assert collector.candleBuilders[738561].Symbol == "RELIANCE"
-        assert collector.candleBuilders[738561].Exchange == "NSE"
+        assert 738561 in pooled_collector.tokenToSymbol
+        assert pooled_collector.tokenToSymbol[738561] == "RELIANCE"
+        assert 738561 in pooled_collector.candleBuilders
+        assert pooled_collector.candleBuilders[738561].Symbol == "RELIANCE"
+        assert pooled_collector.candleBuilders[738561].Exchange == "NSE"
 
-    def test_subscribe_tokens(self, collector):
+    def test_subscribe_tokens(self, pooled_collector):
         """Test token subscription (without actual WebSocket)"""
         tokens = [738561, 2953217, 341249]
 
         # Mock the ticker
-        collector.ticker = Mock()
-        collector.ticker.Subscribe = Mock(return_value=None)
-        collector.running = True
+        pooled_collector.ticker = Mock(spec=TICKER_METHODS, **{'Subscribe.return_value': None})
+        pooled_collector.running = True
 
-        result = collector.Subscribe(tokens)
+        result = pooled_collector.Subscribe(tokens)
 
         assert result is None
-        assert len(collector.subscribedTokens) == 3
-        collector.ticker.Subscribe.assert_called_once_with(tokens)
+        assert len(pooled_collector.subscribedTokens) == 3
+        pooled_collector.ticker.Subscribe.assert_called_once_with(tokens)
 
-    def test_metrics_tracking(self, collector):
+    def test_metrics_tracking(self, pooled_collector):
         """Test metrics are tracked correctly"""
-        collector.ticksReceived = 100
-        collector.barsCreated = 10
-        collector.errors = 2
+        pooled_collector.ticksReceived = 100
+        pooled_collector.barsCreated = 10
+        pooled_collector.errors = 2
 
-        metrics = collector.GetMetrics()
+        metrics = pooled_collector.GetMetrics()
 
         assert metrics['ticks_received'] == 100
         assert metrics['bars_created'] == 10
@@ -167,15 +242,12 @@ class TestDataCollector:
         assert metrics['running'] == False
 
 
-class TestCollectorManager:
+class TestCollectorManager(SharedMockDB):
     """Test CollectorManager class"""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create mock database"""
-        db = Mock()
-        db.GetInstrumentToken = Mock(return_value=738561)
-        return db
+    MOCK_DB_DEFAULTS = {
+        'GetInstrumentToken.return_value': 738561,
+    }
 
     @pytest.fixture
     def manager(self, mock_db):
@@ -184,8 +256,9 @@ class TestCollectorManager:
 
     def test_manager_initialization(self, manager, mock_db):
         """Test CollectorManager initialization"""
-        assert manager.db == mock_db
-        assert len(manager.collectors) == 0
+        snapshot = {"db": manager.db, "collectors": len(manager.collectors)}
+
+        assert snapshot == {"db": mock_db, "collectors": 0}
 
     def test_create_collector(self, manager):
         """Test collector creation"""
@@ -235,29 +308,32 @@ class TestCollectorManager:
         assert "not found" in str(err)
 
 
-@pytest.mark.parametrize("symbol,exchange,expected_token", [
-    ("RELIANCE", "NSE", 738561),
-    ("TCS", "NSE", 2953217),
-    ("INFY", "NSE", 408065),
-])
-def test_symbol_to_token_lookup(symbol, exchange, expected_token):
-    """Test symbol to token lookup (parametrized)"""
+def test_symbol_to_token_lookup():
+    """Test symbol to token lookup"""
+    cases = [
+        ("RELIANCE", "NSE", 738561),
+        ("TCS", "NSE", 2953217),
+        ("INFY", "NSE", 408065),
+    ]
+
     # Mock database
     db = Mock()
-    db.GetInstrumentToken = Mock(return_value=expected_token)
 
-    # Call lookup
-    token = db.GetInstrumentToken(exchange, symbol)
+    for symbol, exchange, expected_token in cases:
+        db.GetInstrumentToken.reset_mock()
+        db.GetInstrumentToken.return_value = expected_token
+
+        # Call lookup
+        token = db.GetInstrumentToken(exchange, symbol)
 
-    assert token == expected_token
-    db.GetInstrumentToken.assert_called_once_with(exchange, symbol)
+        assert token == expected_token, symbol
+        db.GetInstrumentToken.assert_called_once_with(exchange, symbol)
 
 
-def test_candle_minute_boundary():
+def test_candle_minute_boundary(fresh_builder):
     """Test candle flushes at minute boundary"""
-    builder = CandleBuilder()
-    builder.Symbol = "TEST"
-    builder.Timeframe = "1m"
+    from datetime import datetime
+    builder = fresh_builder
 
     # First tick at 10:30:15
     time1 = datetime(2024, 1, 30, 10, 30, 15)
@@ -5,10 +5,6 @@ Tests predefined watchlists and helper functions.
 """
 
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from internal.watchlist.watchlists import (
     Watchlist,
@@ -27,12 +23,43 @@ from internal.watchlist.watchlists import (
 )
 
 
+# Predefined watchlists are built once per module and shared; tests must not mutate them
+@pytest.fixture(scope="module")
+def all_watchlists():
+    """All predefined watchlists"""
+    return GetAllWatchlists()
+
+
+@pytest.fixture(scope="module")
+def nifty50():
+    """NIFTY50 watchlist"""
+    return Nifty50()
+
+
+@pytest.fixture(scope="module")
+def banknifty():
+    """BANKNIFTY watchlist"""
+    return BankNifty()
+
+
+@pytest.fixture(scope="module")
+def it_watchlist():
+    """IT sector watchlist"""
+    return IT()
+
+
+@pytest.fixture(scope="module")
+def pharma():
+    """PHARMA sector watchlist"""
+    return Pharma()
+
+
 class TestWatchlistStructure:
     """Test Watchlist data structure"""
 
-    def test_nifty50_structure(self):
+    def test_nifty50_structure(self, nifty50):
         """Test NIFTY50 watchlist has correct structure"""
-        wl = Nifty50()
+        wl = nifty50
 
         assert isinstance(wl, Watchlist)
         assert wl.Name == "NIFTY50"
@@ -42,27 +69,27 @@ class TestWatchlistStructure:
         assert isinstance(wl.Symbols, list)
         assert len(wl.Symbols) == 50
 
-    def test_banknifty_structure(self):
+    def test_banknifty_structure(self, banknifty):
         """Test BANKNIFTY watchlist"""
-        wl = BankNifty()
+        wl = banknifty
 
         assert wl.Name == "BANKNIFTY"
         assert wl.Category == "index"
         assert wl.Exchange == "NSE"
         assert len(wl.Symbols) == 12
 
-    def test_sector_watchlist_structure(self):
+    def test_sector_watchlist_structure(self, it_watchlist):
         """Test sector watchlist structure"""
-        wl = IT()
+        wl = it_watchlist
 
         assert wl.Name == "IT"
         assert wl.Category == "sector"
         assert wl.Exchange == "NSE"
         assert len(wl.Symbols) >= 10
 
-    def test_symbols_are_strings(self):
+    def test_symbols_are_strings(self, nifty50):
         """Test all symbols are non-empty strings"""
-        wl = Nifty50()
+        wl = nifty50
 
         for symbol in wl.Symbols:
             assert isinstance(symbol, str)
@@ -73,9 +100,9 @@ class TestWatchlistStructure:
 class TestWatchlistRetrieval:
     """Test watchlist retrieval functions"""
 
-    def test_get_all_watchlists(self):
+    def test_get_all_watchlists(self, all_watchlists):
         """Test GetAllWatchlists returns all watchlists"""
-        watchlists = GetAllWatchlists()
+        watchlists = all_watchlists
 
         assert isinstance(watchlists, list)
         assert len(watchlists) == 15  # Total predefined watchlists
@@ -155,7 +182,7 @@ class TestWatchlistFiltering:
 class TestWatchlistMerge:
     """Test watchlist merging functionality"""
 
-    def test_merge_two_watchlists(self):
+    def test_merge_two_watchlists(self, nifty50, banknifty):
         """Test merging two watchlists"""
         merged = MergeWatchlists(["NIFTY50", "BANKNIFTY"])
 
@@ -164,11 +191,8 @@ class TestWatchlistMerge:
         assert merged.Category == "custom"
 
         # Should contain symbols from both (with duplicates removed)
-        nifty50 = GetWatchlist("NIFTY50")
-        banknifty = GetWatchlist("BANKNIFTY")
-
         # Count unique symbols
-        all_symbols = set(nifty50.Symbols + banknifty.Symbols)
+        all_symbols = set(nifty50.Symbols).union(banknifty.Symbols)
         assert len(merged.Symbols) == len(all_symbols)
 
     def test_merge_removes_duplicates(self):
@@ -179,30 +203,28 @@ class TestWatchlistMerge:
         # Check no duplicates
         assert len(merged.Symbols) == len(set(merged.Symbols))
 
-    def test_merge_single_watchlist(self):
+    def test_merge_single_watchlist(self, it_watchlist):
         """Test merging single watchlist"""
         merged = MergeWatchlists(["IT"])
 
         assert merged is not None
-        it_wl = GetWatchlist("IT")
-        assert len(merged.Symbols) == len(it_wl.Symbols)
+        assert len(merged.Symbols) == len(it_watchlist.Symbols)
 
-    def test_merge_nonexistent_watchlist(self):
+    def test_merge_nonexistent_watchlist(self, nifty50):
         """Test merging with non-existent watchlist name"""
         merged = MergeWatchlists(["NIFTY50", "NONEXISTENT"])
 
         # Should only include symbols from NIFTY50
         assert merged is not None
-        nifty50 = GetWatchlist("NIFTY50")
         assert len(merged.Symbols) == len(nifty50.Symbols)
 
 
 class TestSymbolContent:
     """Test specific watchlist symbol content"""
 
-    def test_nifty50_contains_major_stocks(self):
+    def test_nifty50_contains_major_stocks(self, nifty50):
         """Test NIFTY50 contains expected major stocks"""
-        wl = Nifty50()
+        wl = nifty50
 
         # Major stocks that should be in NIFTY50
         expected = ["RELIANCE", "TCS", "HDFCBANK", "INFY", "ICICIBANK"]
@@ -210,9 +232,9 @@ class TestSymbolContent:
         for symbol in expected:
             assert symbol in wl.Symbols
 
-    def test_banknifty_contains_banks(self):
+    def test_banknifty_contains_banks(self, banknifty):
         """Test BANKNIFTY contains bank stocks"""
-        wl = BankNifty()
+        wl = banknifty
 
         # Major banks
         expected = ["HDFCBANK", "ICICIBANK", "SBIN", "KOTAKBANK", "AXISBANK"]
@@ -220,18 +242,18 @@ class TestSymbolContent:
         for symbol in expected:
             assert symbol in wl.Symbols
 
-    def test_it_watchlist_contains_it_stocks(self):
+    def test_it_watchlist_contains_it_stocks(self, it_watchlist):
         """Test IT watchlist contains IT companies"""
-        wl = IT()
+        wl = it_watchlist
 
         expected = ["TCS", "INFY", "WIPRO", "HCLTECH", "TECHM"]
 
         for symbol in expected:
             assert symbol in wl.Symbols
 
-    def test_pharma_watchlist_contains_pharma_stocks(self):
+    def test_pharma_watchlist_contains_pharma_stocks(self, pharma):
         """Test PHARMA watchlist contains pharma companies"""
-        wl = Pharma()
+        wl = pharma
 
         expected = ["SUNPHARMA", "DRREDDY", "CIPLA", "DIVISLAB", "LUPIN"]
 
@@ -239,22 +261,24 @@ class TestSymbolContent:
             assert symbol in wl.Symbols
 
 
-@pytest.mark.parametrize("watchlist_name,expected_min_symbols", [
-    ("NIFTY50", 50),
-    ("BANKNIFTY", 12),
-    ("NIFTYNEXT50", 30),
-    ("NIFTYMIDCAP50", 30),
-    ("IT", 10),
-    ("PHARMA", 10),
-    ("AUTO", 10),
-    ("METAL", 10),
-])
-def test_watchlist_minimum_symbols(watchlist_name, expected_min_symbols):
-    """Test watchlists have minimum expected symbols (parametrized)"""
-    wl = GetWatchlist(watchlist_name)
+def test_watchlist_minimum_symbols():
+    """Test watchlists have minimum expected symbols"""
+    expected_min_symbols = [
+        ("NIFTY50", 50),
+        ("BANKNIFTY", 12),
+        ("NIFTYNEXT50", 30),
+        ("NIFTYMIDCAP50", 30),
+        ("IT", 10),
+        ("PHARMA", 10),
+        ("AUTO", 10),
+        ("METAL", 10),
+    ]
+
+    for watchlist_name, min_symbols in expected_min_symbols:
+        wl = GetWatchlist(watchlist_name)
 
-    assert wl is not None
-    assert len(wl.Symbols) >= expected_min_symbols
+        assert wl is not None, watchlist_name
+        assert len(wl.Symbols) >= min_symbols, watchlist_name
 
 
 @pytest.mark.parametrize("category,expected_count", [
@@ -269,25 +293,25 @@ def test_category_counts(category, expected_count):
     assert len(watchlists) == expected_count
 
 
-def test_all_watchlists_unique_names():
+def test_all_watchlists_unique_names(all_watchlists):
     """Test all watchlist names are unique"""
-    watchlists = GetAllWatchlists()
+    watchlists = all_watchlists
     names = [wl.Name for wl in watchlists]
 
     assert len(names) == len(set(names))
 
 
-def test_all_watchlists_have_symbols():
+def test_all_watchlists_have_symbols(all_watchlists):
     """Test all watchlists have at least one symbol"""
-    watchlists = GetAllWatchlists()
+    watchlists = all_watchlists
 
     for wl in watchlists:
         assert len(wl.Symbols) > 0
 
 
-def test_watchlist_description_not_empty():
+def test_watchlist_description_not_empty(all_watchlists):
     """Test all watchlists have descriptions"""
-    watchlists = GetAllWatchlists()
+    watchlists = all_watchlists
 
     for wl in watchlists:
         assert wl.Description is not None